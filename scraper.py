@@ -11,32 +11,34 @@ Usage:
        CONTENT_TYPE=both       # posts, reels, or both
        POSTS_PER_PROFILE=4
        REELS_PER_PROFILE=2
-  2) pip install python-dotenv selenium
+  2) pip install python-dotenv selenium requests
   3) python final_instascraper_inputjson.py -u selenagomez natgeo instagram
 """
 
+import glob
+import hashlib
+import re
 import json
 import time
 import random
 import logging
-import argparse
-import pickle
+import logging.handlers
+import queue
 import os
 import sys
-from datetime import datetime
-from typing import List, Dict, Optional, Any
-from selenium.webdriver.common.keys import Keys
-
-# Selenium imports for browser automation and waiting
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import TimeoutException, WebDriverException
-
-# dotenv for loading credentials from .env
-from dotenv import load_dotenv
+import tempfile
+import threading
+import multiprocessing
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Callable, List, Dict, Optional, Any, TextIO
+
+# Selenium, requests, dotenv and argparse are imported where they are used so that
+# `--help`, argument errors and import-only consumers skip their import cost.
+if TYPE_CHECKING:
+    import requests
+    from selenium import webdriver
 
 # -----------------------------------------------------------------------------
 # Configuration constants
@@ -44,8 +46,6 @@ from dotenv import load_dotenv
 DEFAULT_WAIT = 15
 SHORT_WAIT = 5
 POST_DISCOVERY_ATTEMPTS = 3
-PROFILE_DELAY_MIN = 10
-PROFILE_DELAY_MAX = 15
 OUTPUT_DIR = "."
 SHORT_WAIT_MIN = 4
 SHORT_WAIT_MAX = 6
@@ -58,9 +58,338 @@ CONTENT_BOTH = "both"
 # Modal navigation constants
 MODAL_NAVIGATION_ATTEMPTS = 3
 MODAL_LOAD_WAIT = 8
+NAVIGATION_WAIT = 4
+
+# GraphQL responses the profile page loads for its own post grid
+GRAPHQL_URL_MARKER = "/graphql/query"
+TIMELINE_CONNECTION_KEY = "xdt_api__v1__feed__user_timeline_graphql_connection"
+NETWORK_POLL_INTERVAL = 0.25
+
+# Combined selectors: each lookup is a single chromedriver round-trip instead
+# of one per alternative. XPath unions and CSS lists match in document order.
+LOGGED_IN_XPATH = (
+    "//input[@aria-label='Search']"
+    " | //a[contains(@href, '/direct/inbox/')]"
+    " | //span[contains(text(), 'Home')]"
+    " | //div[contains(text(), 'Search')]"
+)
+FIRST_POST_CSS = 'article a[href*="/p/"], div._aagw a, a[href*="/p/"]'
+PROFILE_LOADED_XPATH = (
+    "//a[contains(@href, '/p/')]"
+    " | //a[contains(@href, '/reel/')]"
+    " | //header"
+    " | //article"
+)
+NEXT_BUTTON_CSS = (
+    'button._acah, button._aade, button[aria-label="Next"], '
+    'button:has(svg[aria-label="Next"])'
+)
+REEL_LINK_CSS = "a[href*='/reel/']"
+# Short-code of a /p/ or /reel/ URL
+_CONTENT_ID_RE = re.compile(r"/(?:p|reel)/([^/?#]+)")
+# Single-round-trip DOM scripts
+# Distinct hrefs matching arguments[0], capped at arguments[1], deduped in the page
+GRID_LINKS_JS = (
+    "var seen = new Set(), out = [];"
+    "for (const a of document.querySelectorAll(arguments[0])) {"
+    "if (!a.href || seen.has(a.href)) continue;"
+    "seen.add(a.href); out.push(a.href);"
+    "if (out.length >= arguments[1]) break;"
+    "}"
+    "return out;"
+)
+CLICK_FIRST_POST_JS = (
+    "var a = document.querySelector(arguments[0]);"
+    "if (!a) return null; a.click(); return a.href;"
+)
+CLOSE_BUTTON_CSS = (
+    'button._acab, button[aria-label="Close"], [role="button"][aria-label="Close"], '
+    'button:has(svg[aria-label="Close"])'
+)
+
+# Persistent Chrome profile: cookies and disk cache survive between runs
+CHROME_PROFILE_DIR = ".chrome_profile"
 
 # Session persistence
-SESSION_FILE = "instagram_session.pkl"
+# Kept in the home directory so runs from any working directory reuse the same session
+SESSION_DIR = os.path.join(os.path.expanduser("~"), ".instagram_scraper")
+SESSION_FILE = os.path.join(SESSION_DIR, "session.json")
+# Saved sessions _rotate_session cycles through after a block (includes SESSION_FILE)
+SESSION_POOL_GLOB = os.path.join(SESSION_DIR, "session*.json")
+# Older versions saved the session here; restored and copied to SESSION_FILE when that is missing
+LEGACY_SESSION_FILE = "instagram_session.json"
+# Cookies an authenticated session must carry to be worth restoring
+REQUIRED_SESSION_COOKIES = ("sessionid", "csrftoken")
+# Small login-only page: anonymous visitors are redirected to /accounts/login/
+SESSION_CHECK_URL = "https://www.instagram.com/accounts/edit/"
+
+# Browser identity shared by Chrome and the HTTP client
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/120.0.0.0 Safari/537.36"
+)
+
+# navigator.webdriver override installed once for every document Chrome opens
+STEALTH_SCRIPT = "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
+
+# Resources Chrome never needs to fetch: post/reel URLs are read from href
+# attributes, so images, video and fonts are pure download/decode overhead.
+# Stylesheets are kept so the post modal and its buttons lay out normally.
+BLOCKED_URL_PATTERNS = [
+    "*.jpg*", "*.jpeg*", "*.png*", "*.gif*", "*.webp*", "*.heic*",
+    "*.mp4*", "*.m4v*", "*.webm*",
+    "*.woff2*", "*.woff*", "*.ttf*", "*.otf*",
+]
+
+# Instagram web API (JSON) endpoints
+IG_APP_ID = "936619743392459"
+WEB_PROFILE_INFO_URL = "https://www.instagram.com/api/v1/users/web_profile_info/"
+# Paged post feed, used when web_profile_info's first ~12 posts are not enough
+USER_FEED_URL = "https://www.instagram.com/api/v1/feed/user/{user_id}/"
+FEED_PAGE_SIZE = 33
+# Reels tab (POST), used when the profile response carries too few reels
+CLIPS_USER_URL = "https://www.instagram.com/api/v1/clips/user/"
+CLIPS_PAGE_SIZE = 12
+HTTP_TIMEOUT = 15
+
+# Read-through cache of scraped profiles (seconds; 0 disables)
+CACHE_DIR = ".scrape_cache"
+CACHE_TTL = 900
+
+# Incremental NDJSON results on disk (fsync every N profiles)
+RESULTS_FSYNC_EVERY = 10
+
+# Concurrent profile fetching over HTTP
+BATCH_CONCURRENCY = 8
+
+# Browser processes for profiles the HTTP path could not serve (1 = in-process, serial)
+BROWSER_WORKERS = 1
+
+# Adaptive request pacing (Instagram throttles after ~40-50 fast page requests)
+RATE_LIMIT_PER_MIN = 30
+RATE_LIMIT_WINDOW = 60
+RATE_LIMIT_BASE_COOLDOWN = 30
+RATE_LIMIT_MAX_COOLDOWN = 3600
+# Browser retries per profile after a login wall or challenge
+BLOCK_MAX_RETRIES = 2
+
+# Browser profile-page loads: token bucket, halved on throttling, recovered additively
+PROFILE_PAGE_RATE = 1 / 12  # loads per second once the burst is spent
+PROFILE_PAGE_BURST = 3
+PROFILE_PAGE_MIN_RATE = 1 / 300
+
+# -----------------------------------------------------------------------------
+# Timestamps
+# -----------------------------------------------------------------------------
+def _utc_now_iso() -> str:
+    """Current UTC time as e.g. '2024-01-15T10:30:00Z' (second precision)"""
+    return datetime.now(timezone.utc).replace(tzinfo=None).isoformat(timespec="seconds") + "Z"
+
+# -----------------------------------------------------------------------------
+# Exceptions
+# -----------------------------------------------------------------------------
+class RateLimited(Exception):
+    """Instagram sent the browser to a login wall or challenge instead of the page"""
+
+# -----------------------------------------------------------------------------
+# ProfileCache class
+# -----------------------------------------------------------------------------
+class ProfileCache:
+    """
+    File-backed cache of scraped profile dicts with a time-to-live.
+    One JSON file per key; the stored profile keeps its own scraped_at.
+    """
+
+    def __init__(self, cache_dir: str = CACHE_DIR, ttl: int = CACHE_TTL):
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+
+    @staticmethod
+    def make_key(username: str, content_type: str, num_posts: int, num_reels: int) -> str:
+        """Build the cache key for one scrape request"""
+        return f"profile:{username}:{content_type}:{num_posts}:{num_reels}"
+
+    def _path(self, key: str) -> str:
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, f"{digest}.json")
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached profile for key, or None if missing, expired or unreadable"""
+        path = self._path(key)
+        try:
+            if time.time() - os.path.getmtime(path) > self.ttl:
+                return None
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+            return entry["data"] if entry.get("key") == key else None
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def set(self, key: str, data: Dict[str, Any]) -> None:
+        """Store data under key (written atomically via a temp file)"""
+        path = self._path(key)
+        tmp_path = f"{path}.tmp"
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({"key": key, "data": data}, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
+
+# -----------------------------------------------------------------------------
+# ResultsWriter class
+# -----------------------------------------------------------------------------
+class ResultsWriter:
+    """
+    Appends one JSON document per line to a results file as profiles finish,
+    so memory stays flat and an interrupted run keeps what it already scraped.
+    """
+
+    def __init__(self, path: str, fsync_every: int = RESULTS_FSYNC_EVERY):
+        self.path = path
+        self.fsync_every = max(1, fsync_every)
+        self._file = open(path, 'a', encoding='utf-8')
+        # Where this run's records start (the file may hold earlier runs)
+        self.start_offset = self._file.tell()
+        self._written = 0
+
+    def write(self, record: Dict[str, Any]) -> None:
+        """Append one record and flush it; fsync every fsync_every records"""
+        self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._file.flush()
+        self._written += 1
+        if self._written % self.fsync_every == 0:
+            os.fsync(self._file.fileno())
+
+    def close(self) -> None:
+        """Flush, fsync and close the file"""
+        if self._file.closed:
+            return
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._file.close()
+
+    def read_back(self) -> List[Dict[str, Any]]:
+        """Return the records written by this writer, in order"""
+        with open(self.path, 'r', encoding='utf-8') as f:
+            f.seek(self.start_offset)
+            return [json.loads(line) for line in f if line.strip()]
+
+# -----------------------------------------------------------------------------
+# RateLimiter class
+# -----------------------------------------------------------------------------
+class RateLimiter:
+    """
+    Sliding-window limiter for Instagram requests. Only sleeps when the last
+    minute already holds max_per_min requests, and backs off exponentially
+    (with jitter) after a login redirect, challenge or HTTP 429.
+    With share_window_with, both limiters count requests against one window
+    but keep separate cooldowns, so one channel's backoff never blocks the other.
+    """
+
+    def __init__(self, max_per_min: int = RATE_LIMIT_PER_MIN,
+                 share_window_with: Optional["RateLimiter"] = None):
+        self.max_per_min = max(1, max_per_min)
+        self.cooldown = 0.0
+        self._blocked_until = 0.0
+        if share_window_with is not None:
+            self._timestamps = share_window_with._timestamps
+            self._lock = share_window_with._lock
+        else:
+            self._timestamps = deque()
+            self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until another request may be sent, then record it"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                while self._timestamps and now - self._timestamps[0] >= RATE_LIMIT_WINDOW:
+                    self._timestamps.popleft()
+
+                wait = self._blocked_until - now
+                if wait <= 0 and len(self._timestamps) < self.max_per_min:
+                    self._timestamps.append(now)
+                    return
+                if wait <= 0:
+                    wait = RATE_LIMIT_WINDOW - (now - self._timestamps[0])
+            # Sleep without the lock: other waiters wait concurrently and
+            # penalize()/reset() are not held up by a long cooldown
+            time.sleep(wait)
+
+    def penalize(self) -> float:
+        """
+        Double the cooldown after a throttling signal; returns the cooldown in force.
+        Signals that arrive while a cooldown is still running (responses to requests
+        already in flight when it started) do not double it again.
+        """
+        with self._lock:
+            if time.monotonic() < self._blocked_until:
+                return self.cooldown
+            if self.cooldown:
+                self.cooldown = min(self.cooldown * 2, RATE_LIMIT_MAX_COOLDOWN)
+            else:
+                self.cooldown = RATE_LIMIT_BASE_COOLDOWN
+            # Jitter keeps parallel workers from all retrying at the same moment
+            self._blocked_until = time.monotonic() + self.cooldown + random.uniform(0, self.cooldown / 10)
+            return self.cooldown
+
+    def reset(self) -> None:
+        """Clear the backoff after a request went through normally"""
+        with self._lock:
+            self.cooldown = 0.0
+
+# -----------------------------------------------------------------------------
+# TokenBucket class
+# -----------------------------------------------------------------------------
+class TokenBucket:
+    """
+    Token bucket for browser profile-page loads. Allows bursts up to capacity
+    and only waits once they are spent. The refill rate is halved on throttling
+    and recovers additively after normal loads (AIMD).
+    """
+
+    def __init__(self, rate_per_sec: float = PROFILE_PAGE_RATE, capacity: int = PROFILE_PAGE_BURST):
+        self.max_rate = max(PROFILE_PAGE_MIN_RATE, rate_per_sec)
+        self.rate = self.max_rate
+        self.capacity = max(1, capacity)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self) -> float:
+        """Take a token, sleeping only if none is left; returns the seconds waited"""
+        with self._lock:
+            self._refill()
+            # Reserve the token now (the balance may go negative) and sleep until it
+            # has refilled, outside the lock, so concurrent callers wait in parallel
+            # for their own slots instead of queueing behind each other's sleeps
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait:
+            time.sleep(wait)
+        return wait
+
+    def penalize(self) -> float:
+        """Halve the refill rate and drop any saved burst; returns the new rate"""
+        with self._lock:
+            self._refill()
+            self.rate = max(self.rate / 2, PROFILE_PAGE_MIN_RATE)
+            self._tokens = min(self._tokens, 0.0)
+            return self.rate
+
+    def reward(self) -> None:
+        """Step the refill rate back towards its configured maximum"""
+        with self._lock:
+            self._refill()
+            self.rate = min(self.rate + self.max_rate / 4, self.max_rate)
 
 # -----------------------------------------------------------------------------
 # InstagramScraperWithLogin class
@@ -70,66 +399,113 @@ class InstagramScraperWithLogin:
     Enhanced Instagram scraper with modal navigation for sequential post scraping
     """
 
-    def __init__(self, headless: bool = False, wait_timeout: int = DEFAULT_WAIT, quiet: bool = False):
+    def __init__(self, headless: bool = False, wait_timeout: int = DEFAULT_WAIT, quiet: bool = False,
+                 block_media: bool = True, cache_ttl: int = CACHE_TTL,
+                 rate_per_min: int = RATE_LIMIT_PER_MIN,
+                 profile_dir: Optional[str] = CHROME_PROFILE_DIR,
+                 page_rate: float = PROFILE_PAGE_RATE):
         """
         Initialize logger, driver, and explicit wait instance.
+        block_media stops Chrome downloading images, video and fonts.
+        cache_ttl (seconds) enables the profile cache; 0 disables it.
+        rate_per_min caps Instagram requests per minute.
+        profile_dir persists the Chrome profile between runs; None uses a throwaway profile.
+        page_rate caps sustained browser profile-page loads per second (after a short burst).
         """
+        from selenium.webdriver.support.ui import WebDriverWait
+
         self.quiet = quiet
+        # Settings for browser worker processes (see _scrape_profile_worker)
+        self._worker_kwargs = {
+            "headless": headless,
+            "wait_timeout": wait_timeout,
+            "quiet": quiet,
+            "block_media": block_media,
+            "cache_ttl": 0,
+            "rate_per_min": rate_per_min,
+            "profile_dir": profile_dir,
+            "page_rate": page_rate,
+        }
+        # Background thread that writes queued log records (None in quiet mode)
+        self._log_listener: Optional[logging.handlers.QueueListener] = None
+        self._log_queue_handler: Optional[logging.handlers.QueueHandler] = None
         self.setup_logging()
-        if not quiet:
-            self.logger.info("Initializing InstagramScraperWithLogin (Modal Navigation)...")
+        self.logger.info("Initializing InstagramScraperWithLogin (Modal Navigation)...")
 
         # Setup browser driver
-        self.driver = self.setup_driver(headless)
+        self.driver = self.setup_driver(headless, block_media, profile_dir)
         # Explicit wait helper used across the class
         self.wait = WebDriverWait(self.driver, wait_timeout)
-
-        if not quiet:
-            self.logger.info("InstagramScraper initialized with Modal Navigation")
+        # HTTP client for the JSON fast path (seeded from driver cookies after login)
+        self._http_session: Optional["requests.Session"] = None
+        # Session file currently in use (changes when _rotate_session switches sessions)
+        self._session_path = SESSION_FILE
+        # False with --no-session: saved sessions are neither read nor rotated through
+        self.use_session = True
+        # Shared pacing for page loads and API requests
+        self.rate_limiter = RateLimiter(rate_per_min)
+        # JSON API requests share the per-minute budget but back off on their own,
+        # so an API cooldown never delays browser page loads
+        self.api_rate_limiter = RateLimiter(rate_per_min, share_window_with=self.rate_limiter)
+        self.page_bucket = TokenBucket(page_rate)
+        # Read-through cache of scraped profiles
+        self.cache = ProfileCache(CACHE_DIR, cache_ttl) if cache_ttl > 0 else None
+
+        self.logger.info("InstagramScraper initialized with Modal Navigation")
 
     # --------------------------- Logging -----------------------------------
     def setup_logging(self) -> None:
         """
         Configure logging to file and console with timestamped filename.
+        Records are queued and written by a QueueListener thread, so log calls
+        in the scraping loops never block on file or console I/O.
         """
         if self.quiet:
-            # Disable all logging in quiet mode
+            # Disable all logging in quiet mode; log calls are then dropped before formatting
             logging.basicConfig(level=logging.WARNING)
             self.logger = logging.getLogger(__name__)
-            self.logger.setLevel(logging.WARNING)
+            self.logger.setLevel(logging.CRITICAL + 1)
             return
 
         ts = datetime.now().strftime("%Y%m%d_%H%M%S")
         log_path = os.path.join(OUTPUT_DIR, f"instagram_scraper_{ts}.log")
 
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(log_path, encoding='utf-8'),
-                logging.StreamHandler()
-            ]
-        )
+        root_logger = logging.getLogger()
+        if not root_logger.handlers:
+            formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+            file_handler = logging.FileHandler(log_path, encoding='utf-8')
+            file_handler.setFormatter(formatter)
+            stream_handler = logging.StreamHandler()
+            stream_handler.setFormatter(formatter)
+
+            log_queue = queue.Queue(-1)
+            self._log_listener = logging.handlers.QueueListener(log_queue, file_handler, stream_handler)
+            self._log_listener.start()
+            self._log_queue_handler = logging.handlers.QueueHandler(log_queue)
+            root_logger.addHandler(self._log_queue_handler)
+            root_logger.setLevel(logging.INFO)
         self.logger = logging.getLogger(__name__)
-        self.logger.info(f"Logging started - file: {log_path}")
+        self.logger.info("Logging started - file: %s", log_path)
 
     # --------------------------- Driver Setup ------------------------------
-    def setup_driver(self, headless: bool) -> webdriver.Chrome:
+    def setup_driver(self, headless: bool, block_media: bool = True,
+                     profile_dir: Optional[str] = None) -> "webdriver.Chrome":
         """
         Build and return a configured Chrome WebDriver instance.
         """
-        if not self.quiet:
-            self.logger.info("Setting up Chrome driver...")
+        from selenium import webdriver
+        from selenium.webdriver.chrome.options import Options
+        from selenium.common.exceptions import WebDriverException
+
+        self.logger.info("Setting up Chrome driver...")
         chrome_options = Options()
 
         # Headless option (modern Chrome uses "--headless=new")
         if headless:
             chrome_options.add_argument("--headless=new")
-            if not self.quiet:
-                self.logger.info("Headless mode enabled")
+            self.logger.info("Headless mode enabled")
         else:
-            if not self.quiet:
-                self.logger.info("Headless mode disabled (visible browser)")
+            self.logger.info("Headless mode disabled (visible browser)")
 
         # Common arguments to improve stability and reduce crashes in containers
         chrome_options.add_argument("--no-sandbox")
@@ -138,187 +514,398 @@ class InstagramScraperWithLogin:
         chrome_options.add_argument("--disable-features=IsolateOrigins,site-per-process")
         chrome_options.add_argument("--window-size=1920,1080")
 
+        # Reuse a persistent profile so cookies and cached assets survive restarts
+        if profile_dir:
+            profile_path = os.path.abspath(profile_dir)
+            chrome_options.add_argument(f"--user-data-dir={profile_path}")
+            chrome_options.add_argument("--profile-directory=Default")
+            self.logger.info("Using persistent Chrome profile: %s", profile_path)
+
         # Set a recent desktop-like user agent to reduce bot detection
-        chrome_options.add_argument(
-            "--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/120.0.0.0 Safari/537.36"
-        )
+        chrome_options.add_argument(f"--user-agent={USER_AGENT}")
+
+        # Return from driver.get() at DOMContentLoaded instead of the full load event:
+        # Instagram renders client-side, and every navigation is followed by an explicit
+        # wait for the element, URL or network response it actually needs
+        chrome_options.page_load_strategy = "eager"
 
         # Avoid automation extension flags
         chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
         chrome_options.add_experimental_option("useAutomationExtension", False)
 
+        # Record network events so the profile's own GraphQL responses can be read back
+        chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+
+        # Never render images (belt and braces with the CDP URL block below)
+        if block_media:
+            chrome_options.add_experimental_option(
+                "prefs", {"profile.managed_default_content_settings.images": 2}
+            )
+
         # Instantiate driver
         try:
             driver = webdriver.Chrome(options=chrome_options)
-            # More robust stealth injection using CDP - set navigator.webdriver to undefined
-            try:
-                driver.execute_cdp_cmd(
-                    "Page.addScriptToEvaluateOnNewDocument",
-                    {
-                        "source": "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
-                    }
-                )
-            except Exception:
-                # Not critical — log and continue
-                if not self.quiet:
-                    self.logger.debug("CDP stealth script injection failed (non-critical)")
+            # Stealth setup as one CDP sequence at startup; Chrome re-applies these
+            # to every later document, so nothing is re-sent per driver.get
+            stealth_commands = [
+                ("Page.addScriptToEvaluateOnNewDocument", {"source": STEALTH_SCRIPT}),
+                ("Network.setUserAgentOverride", {"userAgent": USER_AGENT}),
+                ("Page.setBypassCSP", {"enabled": True}),
+            ]
+            for command, params in stealth_commands:
+                try:
+                    driver.execute_cdp_cmd(command, params)
+                except Exception:
+                    # Not critical — log and continue
+                    self.logger.debug("CDP %s failed (non-critical)", command)
+
+            # Block media/font downloads; links are still read from href attributes
+            if block_media:
+                try:
+                    driver.execute_cdp_cmd("Network.enable", {})
+                    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+                    self.logger.info("Media/font requests blocked via CDP")
+                except Exception:
+                    self.logger.debug("CDP URL blocking failed (non-critical)")
 
             # Set a sensible page load timeout (so driver.get doesn't hang forever)
             driver.set_page_load_timeout(30)
-            if not self.quiet:
-                self.logger.info("Chrome driver setup completed")
+            self.logger.info("Chrome driver setup completed")
             return driver
 
         except WebDriverException as e:
-            if not self.quiet:
-                self.logger.error(f"Failed to start Chrome driver: {e}")
+            self.logger.error("Failed to start Chrome driver: %s", e)
             raise
 
     # --------------------------- Session Management ------------------------
-    def save_session(self) -> bool:
+    def save_session(self, path: Optional[str] = None) -> bool:
         """
-        Save current session cookies to file for future use
+        Save current session cookies to the session file in use, for future runs,
+        or to path (without switching the session file in use)
         """
+        path = path or self._session_path
         try:
-            # Ensure we're on Instagram domain to get proper cookies
-            self.driver.get("https://www.instagram.com/")
-            time.sleep(2)
-            
-            cookies = self.driver.get_cookies()
+            cookies = self._get_instagram_cookies()
             session_data = {
                 'cookies': cookies,
-                'saved_at': datetime.now().isoformat(),
+                # Plain name -> value mapping, directly usable as requests cookies
+                'cookie_dict': {c['name']: c['value'] for c in cookies},
+                'saved_at': _utc_now_iso(),
                 'user_agent': self.driver.execute_script("return navigator.userAgent;")
             }
             
-            with open(SESSION_FILE, 'wb') as f:
-                pickle.dump(session_data, f)
+            # The session is a login credential: keep its directory private
+            os.makedirs(os.path.dirname(path) or ".", mode=0o700, exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(session_data, f)
                 
-            if not self.quiet:
-                self.logger.info(f"Session saved to {SESSION_FILE} with {len(cookies)} cookies")
+            self.logger.info("Session saved to %s with %d cookies", path, len(cookies))
             return True
         except Exception as e:
-            if not self.quiet:
-                self.logger.error(f"Failed to save session: {e}")
+            self.logger.error("Failed to save session: %s", e)
             return False
 
-    def load_session(self) -> bool:
+    def _get_instagram_cookies(self) -> List[Dict[str, Any]]:
         """
-        Load session cookies from file and check if still valid
+        Return Instagram cookies in WebDriver format. Uses one CDP
+        Network.getAllCookies call, which works from any page; falls back to
+        get_cookies(), which needs the browser to be on instagram.com.
         """
         try:
-            if not os.path.exists(SESSION_FILE):
-                if not self.quiet:
-                    self.logger.info("No session file found")
-                return False
+            cdp_cookies = self.driver.execute_cdp_cmd("Network.getAllCookies", {})["cookies"]
+            cookies = []
+            for c in cdp_cookies:
+                if not c.get("domain", "").endswith("instagram.com"):
+                    continue
+                cookie = {
+                    "name": c["name"],
+                    "value": c["value"],
+                    "domain": c["domain"],
+                    "path": c.get("path", "/"),
+                    "secure": c.get("secure", False),
+                    "httpOnly": c.get("httpOnly", False),
+                }
+                if c.get("sameSite"):
+                    cookie["sameSite"] = c["sameSite"]
+                if not c.get("session") and c.get("expires", -1) > 0:
+                    cookie["expiry"] = int(c["expires"])
+                cookies.append(cookie)
+            return cookies
+        except Exception as e:
+            self.logger.debug("CDP cookie read failed, using get_cookies(): %s", e)
 
-            with open(SESSION_FILE, 'rb') as f:
-                session_data = pickle.load(f)
-            # Navigate to Instagram first
+        # Ensure we're on Instagram domain to get proper cookies
+        if "instagram.com" not in self.driver.current_url:
             self.driver.get("https://www.instagram.com/")
-            time.sleep(2)
-            
-            # Clear existing cookies and load saved ones
+        return self.driver.get_cookies()
+
+    def _set_cookies_via_cdp(self, cookies: List[Dict[str, Any]]) -> bool:
+        """
+        Replace the browser's cookies with the saved ones using a single CDP
+        Network.setCookies call (works from any page). Returns False if CDP is
+        unavailable so the caller can fall back to add_cookie().
+        """
+        cdp_cookies = []
+        for c in cookies:
+            cdp_cookie = {
+                "name": c["name"],
+                "value": c["value"],
+                "domain": c.get("domain", ".instagram.com"),
+                "path": c.get("path", "/"),
+                "secure": c.get("secure", False),
+                "httpOnly": c.get("httpOnly", False),
+            }
+            if c.get("sameSite"):
+                cdp_cookie["sameSite"] = c["sameSite"]
+            if c.get("expiry"):
+                cdp_cookie["expires"] = c["expiry"]
+            cdp_cookies.append(cdp_cookie)
+
+        try:
+            self.driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            self.driver.execute_cdp_cmd("Network.setCookies", {"cookies": cdp_cookies})
+        except Exception as e:
+            self.logger.debug("CDP cookie restore failed, using add_cookie(): %s", e)
+            return False
+
+        # setCookies reports no per-cookie status, so compare against what the browser kept
+        # (an extra CDP round-trip, only worth it when the result is logged)
+        if self.logger.isEnabledFor(logging.WARNING):
+            restored = {c["name"] for c in self._get_instagram_cookies()}
+            rejected = sorted({c["name"] for c in cdp_cookies} - restored)
+            if rejected:
+                self.logger.warning("Browser rejected cookies: %s", ', '.join(rejected))
+            self.logger.info("Restored %d cookies via CDP", len(cdp_cookies) - len(rejected))
+        return True
+
+    def _restore_cookies(self, cookies: List[Dict[str, Any]]) -> None:
+        """Replace the browser's cookies with the given ones"""
+        # Clear existing cookies and load saved ones (one CDP call when available)
+        if not self._set_cookies_via_cdp(cookies):
+            # Cookies can only be added for the current domain - navigate only if needed
+            if "instagram.com" not in self.driver.current_url:
+                self.driver.get("https://www.instagram.com/")
+                self._wait_for_page_ready()
+
             self.driver.delete_all_cookies()
             
-            for cookie in session_data['cookies']:
+            for cookie in cookies:
                 try:
                     self.driver.add_cookie(cookie)
                 except Exception as e:
-                    if not self.quiet:
-                        self.logger.debug(f"Could not add cookie: {e}")
+                    self.logger.debug("Could not add cookie: %s", e)
                     continue
 
-            # Refresh to apply cookies
-            self.driver.refresh()
-            time.sleep(3)
+    def load_session(self, path: str = SESSION_FILE, remove_invalid: bool = True) -> bool:
+        """
+        Load session cookies from file and check if still valid.
+        A file that is not valid session JSON is deleted unless remove_invalid is False;
+        browser or network errors never delete it.
+        """
+        source = path
+        if path == SESSION_FILE and not os.path.exists(path) and os.path.exists(LEGACY_SESSION_FILE):
+            source = LEGACY_SESSION_FILE
+        if not os.path.exists(source):
+            self.logger.info("No session file found")
+            return False
+
+        try:
+            with open(source, 'r', encoding='utf-8') as f:
+                session_data = json.load(f)
+
+            # Reject sessions that lack the auth cookies before touching the browser
+            cookies = session_data['cookies']
+            cookie_names = {c.get('name') for c in cookies}
+            missing = [name for name in REQUIRED_SESSION_COOKIES if name not in cookie_names]
+            if missing:
+                raise ValueError(f"session file missing cookies: {', '.join(missing)}")
+        except OSError as e:
+            self.logger.error("Failed to read session file %s: %s", source, e)
+            return False
+        except (ValueError, KeyError, TypeError, AttributeError) as e:
+            self.logger.error("Invalid session file %s: %s", source, e)
+            if remove_invalid:
+                try:
+                    os.remove(source)
+                except OSError:
+                    pass
+            return False
+
+        try:
+            self._restore_cookies(cookies)
+
+            # Open a login-only page with the restored cookies; a redirect means the session expired
+            # (server-side, so the final URL is known as soon as driver.get() returns)
+            self.driver.get(SESSION_CHECK_URL)
+            if "/accounts/login" in self.driver.current_url:
+                self.logger.info("Session expired - redirected to login page")
+                return False
 
-            # Check if we're logged in by trying to access a protected page
-            return self._check_login_status()
+            self.logger.info("Session loaded successfully - logged in detected")
+            self._session_path = path
+            if source != path:
+                # Migrate a legacy session so later runs read SESSION_FILE directly
+                self.logger.info("Migrating session from %s to %s", source, path)
+                self.save_session()
+            return True
 
         except Exception as e:
-            if not self.quiet:
-                self.logger.error(f"Failed to load session: {e}")
-            # Clean up invalid session file
-            try:
-                #the session will be added with the list of cookies
-                
-                os.remove(SESSION_FILE)
-            except:
-                pass
+            # The file itself is fine; keep it for the next run
+            self.logger.error("Failed to load session: %s", e)
+            return False
+
+    def _clear_browser_cookies(self) -> None:
+        """
+        Delete every cookie in the browser. CDP clears all domains from any page;
+        WebDriver's delete_all_cookies() only reaches the current document's domain.
+        """
+        try:
+            self.driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        except Exception as e:
+            self.logger.debug("CDP cookie clear failed, using delete_all_cookies(): %s", e)
+            if "instagram.com" not in self.driver.current_url:
+                self.driver.get("https://www.instagram.com/")
+            self.driver.delete_all_cookies()
+
+    def _rotate_session(self) -> bool:
+        """
+        Switch to another saved session in SESSION_POOL_GLOB after a block, trying the
+        ones after the current file in sorted order (wrapping around). Returns False
+        if there is no other session or none is accepted; the browser then keeps
+        its previous cookies and pool files are never deleted.
+        """
+        if not self.use_session:
+            return False
+        pool = sorted(glob.glob(SESSION_POOL_GLOB))
+        if self._session_path in pool:
+            current = pool.index(self._session_path)
+            candidates = pool[current + 1:] + pool[:current]
+        else:
+            candidates = pool
+        if not candidates:
+            self.logger.warning("No other saved session to rotate to")
+            return False
+
+        try:
+            previous_cookies = self._get_instagram_cookies()
+        except Exception as e:
+            self.logger.warning("Could not read current cookies - not rotating: %s", e)
             return False
 
+        for path in candidates:
+            # Restoring loads a page, so it waits out the cooldown like any other request
+            self.rate_limiter.acquire()
+            self.logger.info("Rotating to session %s", path)
+            if self.load_session(path, remove_invalid=False):
+                self._init_http_session()
+                return True
+            # A rejected session may have replaced the cookies already: put the old login back
+            try:
+                self._restore_cookies(previous_cookies)
+            except Exception as e:
+                self.logger.warning("Could not restore previous cookies: %s", e)
+                return False
+
+        self.logger.warning("No saved session could be restored - keeping the current one")
+        return False
+
+    def _is_already_logged_in(self) -> bool:
+        """Check whether the browser profile is already authenticated"""
+        try:
+            # Cold profile: no sessionid cookie at all, so skip the page load
+            if not any(c["name"] == "sessionid" and c.get("value") for c in self._get_instagram_cookies()):
+                return False
+            self.driver.get("https://www.instagram.com/")
+            self._wait_for_page_ready()
+            if self._check_login_status():
+                self.logger.info("Browser profile already logged in - skipping session restore")
+                return True
+        except Exception as e:
+            self.logger.debug("Could not check existing browser login: %s", e)
+        return False
+
     def _check_login_status(self) -> bool:
         """Check if we're properly logged in"""
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.common.exceptions import TimeoutException
+
         try:
-            # Try multiple indicators of being logged in
-            indicators = [
-                "//input[@aria-label='Search']",
-                "//a[contains(@href, '/direct/inbox/')]",
-                "//span[contains(text(), 'Home')]",
-                "//div[contains(text(), 'Search')]"
-            ]
-            
-            for indicator in indicators:
-                try:
-                    WebDriverWait(self.driver, 5).until(
-                        EC.presence_of_element_located((By.XPATH, indicator))
-                    )
-                    if not self.quiet:
-                        self.logger.info("Session loaded successfully - logged in detected")
-                    return True
-                except TimeoutException:
-                    continue
+            # No sessionid cookie means not logged in - no need to poll the DOM
+            session_cookie = self.driver.get_cookie("sessionid")
+            if not session_cookie or not session_cookie.get("value"):
+                self.logger.info("No sessionid cookie - not logged in")
+                return False
+
+            # Any of the logged-in indicators (single union XPath)
+            try:
+                WebDriverWait(self.driver, SHORT_WAIT).until(
+                    EC.presence_of_element_located((By.XPATH, LOGGED_IN_XPATH))
+                )
+                self.logger.info("Session loaded successfully - logged in detected")
+                return True
+            except TimeoutException:
+                pass
             
             # If no indicators found, check if we're redirected to login page
             current_url = self.driver.current_url
             if "accounts/login" in current_url or "login" in current_url:
-                if not self.quiet:
-                    self.logger.info("Session expired - redirected to login page")
+                self.logger.info("Session expired - redirected to login page")
                 return False
                 
             # If we're on Instagram but not logged in, try to check for login prompts
             try:
                 login_elements = self.driver.find_elements(By.XPATH, "//button[contains(text(), 'Log in')]")
                 if login_elements:
-                    if not self.quiet:
-                        self.logger.info("Session expired - login button present")
+                    self.logger.info("Session expired - login button present")
                     return False
             except:
                 pass
                 
             # Conservative approach - if we can't confirm login, assume not logged in
-            if not self.quiet:
-                self.logger.info("Cannot confirm login status - assuming session expired")
+            self.logger.info("Cannot confirm login status - assuming session expired")
             return False
             
         except Exception as e:
-            if not self.quiet:
-                self.logger.debug(f"Error checking login status: {e}")
+            self.logger.debug("Error checking login status: %s", e)
             return False
 
     # --------------------------- Login ------------------------------------
-    def login(self, username: str, password: str, use_session: bool = True) -> bool:
+    def login(self, username: Optional[str], password: Optional[str], use_session: bool = True) -> bool:
         """
         Login to Instagram using provided credentials or saved session.
+        Credentials are only needed when no saved session is valid.
         Returns True when login appears successful, False otherwise.
         """
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
+
+        self.use_session = use_session
+        # A persistent Chrome profile may already be logged in: skip cookies and credentials
+        if use_session and self._is_already_logged_in():
+            self._init_http_session()
+            return True
+
         # Try to load existing session first
         if use_session and self.load_session():
+            self._init_http_session()
             return True
 
-        if not self.quiet:
-            self.logger.info(f"Attempting fresh login as: {username}")
+        if not username or not password:
+            self.logger.error("No valid saved session and no credentials to log in with")
+            return False
+
+        self.logger.info("Attempting fresh login as: %s", username)
 
         try:
-            # Clear any existing cookies first
-            self.driver.delete_all_cookies()
+            # Clear any existing cookies first (including a persistent profile's login)
+            self._clear_browser_cookies()
             
             # Open the login page and wait for the username field
             self.driver.get("https://www.instagram.com/accounts/login/")
-            time.sleep(2)
             
             # Wait for the username input to appear
             self.wait.until(EC.presence_of_element_located((By.NAME, "username")))
@@ -327,49 +914,54 @@ class InstagramScraperWithLogin:
             username_field = self.driver.find_element(By.NAME, "username")
             username_field.clear()
             username_field.send_keys(username)
-            if not self.quiet:
-                self.logger.debug("Entered username")
+            self.logger.debug("Entered username")
 
             password_field = self.driver.find_element(By.NAME, "password")
             password_field.clear()
             password_field.send_keys(password)
-            if not self.quiet:
-                self.logger.debug("Entered password")
+            self.logger.debug("Entered password")
 
             # Click the login submit button (type='submit')
             login_button = self.driver.find_element(By.XPATH, "//button[@type='submit']")
             login_button.click()
-            if not self.quiet:
-                self.logger.info("Login submitted - waiting for post-login state")
-            time.sleep(random.uniform(2.0, 3.0))
+            self.logger.info("Login submitted - waiting for post-login state")
+            # Wait until we leave the login page or an error alert is shown
+            try:
+                WebDriverWait(self.driver, DEFAULT_WAIT).until(
+                    lambda driver: "accounts/login" not in driver.current_url
+                    or driver.find_elements(By.ID, "slfErrorAlert")
+                )
+            except TimeoutException:
+                pass
 
             # Handle possible login challenges
             current_url = self.driver.current_url
             
             # Check for various post-login states
             if "challenge" in current_url or "two_factor" in current_url:
-                if not self.quiet:
-                    self.logger.warning("Login challenge detected - manual intervention may be required")
-                # Wait a bit longer for challenge
-                time.sleep(5)
+                self.logger.warning("Login challenge detected - manual intervention may be required")
+                # Give the challenge a chance to resolve before checking the home page
+                try:
+                    WebDriverWait(self.driver, SHORT_WAIT).until(
+                        lambda driver: "challenge" not in driver.current_url
+                        and "two_factor" not in driver.current_url
+                    )
+                except TimeoutException:
+                    pass
             
             # Wait for either the home page to load or for a login error
             try:
-                # Wait for indicators of successful login
-                WebDriverWait(self.driver, 15).until(
-                    lambda driver: any([
-                        driver.find_elements(By.XPATH, "//input[@aria-label='Search']"),
-                        driver.find_elements(By.XPATH, "//a[contains(@href, '/direct/inbox/')]"),
-                        driver.find_elements(By.XPATH, "//span[contains(text(), 'Home')]")
-                    ])
-                )
+                # Wait for indicators of successful login (single union XPath per poll)
+                WebDriverWait(
+                    self.driver, 15, ignored_exceptions=(StaleElementReferenceException,)
+                ).until(EC.presence_of_element_located((By.XPATH, LOGGED_IN_XPATH)))
                 
-                if not self.quiet:
-                    self.logger.info("Login successful - home page detected")
+                self.logger.info("Login successful - home page detected")
                 
                 # Save session for future use
                 if use_session:
                     self.save_session()
+                self._init_http_session()
                 return True
                 
             except TimeoutException:
@@ -377,8 +969,7 @@ class InstagramScraperWithLogin:
                 try:
                     error_element = self.driver.find_element(By.ID, "slfErrorAlert")
                     if error_element:
-                        if not self.quiet:
-                            self.logger.error("Login failed - incorrect credentials")
+                        self.logger.error("Login failed - incorrect credentials")
                         return False
                 except:
                     pass
@@ -386,107 +977,515 @@ class InstagramScraperWithLogin:
                 # If we're not on login page but no home page elements, check current URL
                 current_url = self.driver.current_url
                 if "accounts/login" in current_url:
-                    if not self.quiet:
-                        self.logger.error("Login failed - still on login page")
+                    self.logger.error("Login failed - still on login page")
                     return False
                 else:
                     # We're not on login page but couldn't find home elements - conservative approach
-                    if not self.quiet:
-                        self.logger.warning("Unclear login status - proceeding cautiously")
+                    self.logger.warning("Unclear login status - proceeding cautiously")
                     # Still save session as we might be logged in
                     if use_session:
                         self.save_session()
+                    self._init_http_session()
                     return True
 
         except Exception as e:
-            if not self.quiet:
-                self.logger.error(f"Login encountered an exception: {e}")
+            self.logger.error("Login encountered an exception: %s", e)
             return False
 
+    # --------------------------- HTTP (JSON) Fast Path ---------------------------
+    def _init_http_session(self) -> None:
+        """
+        Build a requests.Session carrying the browser's cookies so profile data
+        can be fetched from Instagram's JSON endpoints without rendering pages.
+        """
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        try:
+            session = requests.Session()
+            for cookie in self.driver.get_cookies():
+                session.cookies.set(
+                    cookie['name'],
+                    cookie['value'],
+                    domain=cookie.get('domain', '.instagram.com'),
+                    path=cookie.get('path', '/')
+                )
+            # Size the connection pool so concurrent batch fetches reuse connections
+            adapter = HTTPAdapter(
+                pool_connections=BATCH_CONCURRENCY, pool_maxsize=BATCH_CONCURRENCY * 2
+            )
+            session.mount("https://", adapter)
+            session.headers.update({
+                "User-Agent": USER_AGENT,
+                "X-IG-App-ID": IG_APP_ID,
+                "X-Requested-With": "XMLHttpRequest",
+                "Referer": "https://www.instagram.com/",
+            })
+            csrf_token = session.cookies.get('csrftoken')
+            if csrf_token:
+                session.headers["X-CSRFToken"] = csrf_token
+            self._http_session = session
+            self.logger.info("HTTP session initialized with %d cookies", len(session.cookies))
+        except Exception as e:
+            self._http_session = None
+            self.logger.warning("Could not initialize HTTP session (Selenium only): %s", e)
+
+    def _request_api_json(self, url: str, what: str, params: Optional[Dict[str, Any]] = None,
+                          data: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        """
+        Call a JSON endpoint with the HTTP session (POST when data is given), paced
+        by the rate limiter. Returns the decoded payload, or None when the request is
+        redirected to login, throttled or otherwise fails (what names it in logs).
+        """
+        import requests
+
+        session = self._http_session
+        if session is None:
+            return None
+
+        self.api_rate_limiter.acquire()
+        try:
+            response = session.request(
+                "POST" if data is not None else "GET",
+                url,
+                params=params,
+                data=data,
+                timeout=HTTP_TIMEOUT,
+                allow_redirects=False
+            )
+        except requests.RequestException as e:
+            self.logger.warning("%s request failed: %s", what, e)
+            return None
+
+        if response.is_redirect:
+            location = response.headers.get('Location', '?')
+            if "accounts/login" in location or "challenge" in location:
+                # The API will not take this session: that is not throttling, so stop
+                # using it (remaining profiles go to the browser) instead of backing off
+                if self._http_session is session:
+                    self._http_session = None
+                    self.logger.warning(
+                        "%s redirected (%s) to %s - session not accepted by the API, "
+                        "using the browser from now on", what, response.status_code, location
+                    )
+                return None
+            self.logger.warning("%s redirected (%s) to %s", what, response.status_code, location)
+            return None
+
+        if response.status_code == 429:
+            cooldown = self.api_rate_limiter.penalize()
+            self.logger.warning("%s rate limited (HTTP 429) - backing off %.0fs", what, cooldown)
+            return None
+
+        if response.status_code != 200:
+            self.logger.warning("%s returned HTTP %s", what, response.status_code)
+            return None
+
+        try:
+            payload = response.json()
+        except ValueError as e:
+            self.logger.warning("%s returned invalid JSON: %s", what, e)
+            return None
+
+        self.api_rate_limiter.reset()
+        return payload
+
+    def fetch_profile_graphql(self, username: str) -> Optional[Dict[str, Any]]:
+        """
+        Fetch the raw profile JSON (``data.user``) from the web_profile_info endpoint.
+        Returns None when the request is redirected to login or otherwise fails.
+        """
+        payload = self._request_api_json(WEB_PROFILE_INFO_URL, f"web_profile_info for {username}",
+                                         params={"username": username})
+        if payload is None:
+            return None
+
+        try:
+            user = payload["data"]["user"]
+        except (KeyError, TypeError) as e:
+            self.logger.warning("Unexpected web_profile_info payload for %s: %s", username, e)
+            return None
+
+        if not user:
+            self.logger.warning("web_profile_info returned no user for %s", username)
+            return None
+        return user
+
+    def fetch_feed_shortcodes(self, user_id: str, needed: int, seen: set) -> List[str]:
+        """
+        Page through the user's post feed for up to `needed` shortcodes not already
+        in `seen` (which is updated). Returns fewer when the feed ends or a request fails.
+        """
+        def fetch_page(max_id: Optional[str]):
+            params = {"count": FEED_PAGE_SIZE}
+            if max_id:
+                params["max_id"] = max_id
+            payload = self._request_api_json(USER_FEED_URL.format(user_id=user_id),
+                                             f"feed for user {user_id}", params=params)
+            if payload is None:
+                return None
+            codes = [item.get("code") for item in payload.get("items") or []]
+            return codes, payload.get("next_max_id") if payload.get("more_available") else None
+
+        return self._collect_paged_shortcodes(fetch_page, needed, seen)
+
+    def fetch_clips_shortcodes(self, user_id: str, needed: int, seen: set) -> List[str]:
+        """
+        Page through the user's reels tab for up to `needed` shortcodes not already
+        in `seen` (which is updated). Returns fewer when the tab ends or a request fails.
+        """
+        def fetch_page(max_id: Optional[str]):
+            data = {"target_user_id": user_id, "page_size": CLIPS_PAGE_SIZE, "include_feed_video": "true"}
+            if max_id:
+                data["max_id"] = max_id
+            payload = self._request_api_json(CLIPS_USER_URL, f"clips for user {user_id}", data=data)
+            if payload is None:
+                return None
+            codes = [(item.get("media") or {}).get("code") for item in payload.get("items") or []]
+            paging = payload.get("paging_info") or {}
+            return codes, paging.get("max_id") if paging.get("more_available") else None
+
+        return self._collect_paged_shortcodes(fetch_page, needed, seen)
+
+    @staticmethod
+    def _collect_paged_shortcodes(fetch_page, needed: int, seen: set) -> List[str]:
+        """
+        Call fetch_page(max_id) -> (codes, next_max_id) or None until `needed` new
+        shortcodes are collected or there are no more pages.
+        """
+        shortcodes = []
+        max_id = None
+        while len(shortcodes) < needed:
+            page = fetch_page(max_id)
+            if page is None:
+                break
+            codes, max_id = page
+            for code in codes:
+                if code and code not in seen:
+                    seen.add(code)
+                    shortcodes.append(code)
+                    if len(shortcodes) >= needed:
+                        break
+            if not max_id:
+                break
+        return shortcodes
+
+    def _scrape_profile_via_http(self, username: str, num_posts: int, num_reels: int,
+                                 content_type: str, scraped_at: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Build profile data from the JSON endpoint. Returns None if the caller
+        should fall back to browser scraping.
+        """
+        user = self.fetch_profile_graphql(username)
+        if user is None:
+            return None
+
+        # One timestamp for the profile and every item in it
+        scraped_at = scraped_at or _utc_now_iso()
+        profile_data = self._new_profile_data(username, scraped_at)
+
+        timeline_media = user.get("edge_owner_to_timeline_media") or {}
+        timeline = [(edge or {}).get("node") or {} for edge in timeline_media.get("edges") or []]
+
+        want_posts = content_type in [CONTENT_POSTS, CONTENT_BOTH] and num_posts > 0
+        want_reels = content_type in [CONTENT_REELS, CONTENT_BOTH] and num_reels > 0
+
+        post_codes = []
+        if want_posts:
+            post_codes = [node["shortcode"] for node in timeline if node.get("shortcode")]
+
+        reel_codes = []
+        if want_reels:
+            reel_nodes = [(edge or {}).get("node") or {} for edge in
+                          (user.get("edge_felix_video_timeline") or {}).get("edges") or []]
+            if not reel_nodes:
+                # Reels also appear in the main timeline as "clips"
+                reel_nodes = [node for node in timeline if node.get("product_type") == "clips"]
+            reel_codes = [node["shortcode"] for node in reel_nodes if node.get("shortcode")]
+
+        # The profile response only embeds the first page of each tab; fetch the
+        # missing posts and reels pages concurrently rather than one after the other
+        user_id = user.get("id")
+        more_posts = (want_posts and user_id and len(post_codes) < num_posts
+                      and (timeline_media.get("page_info") or {}).get("has_next_page"))
+        more_reels = want_reels and user_id and len(reel_codes) < num_reels
+        if more_posts or more_reels:
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                posts_future = reels_future = None
+                if more_posts:
+                    posts_future = executor.submit(self.fetch_feed_shortcodes, user_id,
+                                                   num_posts - len(post_codes), set(post_codes))
+                if more_reels:
+                    reels_future = executor.submit(self.fetch_clips_shortcodes, user_id,
+                                                   num_reels - len(reel_codes), set(reel_codes))
+                if posts_future:
+                    post_codes += posts_future.result()
+                if reels_future:
+                    reel_codes += reels_future.result()
+
+        for shortcode in post_codes[:num_posts]:
+            profile_data["posts"].append({
+                "content_url": f"https://www.instagram.com/p/{shortcode}/",
+                "content_id": shortcode,
+                "scraped_at": scraped_at,
+                "content_type": "post",
+                "order": len(profile_data["posts"]) + 1
+            })
+
+        for shortcode in reel_codes[:num_reels]:
+            profile_data["reels"].append({
+                "content_url": f"https://www.instagram.com/reel/{shortcode}/",
+                "content_id": shortcode,
+                "scraped_at": scraped_at,
+                "content_type": "reel",
+                "order": len(profile_data["reels"]) + 1
+            })
+
+        self.logger.info(
+            "HTTP path: %d posts, %d reels for %s",
+            len(profile_data['posts']), len(profile_data['reels']), username
+        )
+        return profile_data
+
     # --------------------------- Enhanced Profile Scrape ---------------------------
     def scrape_profile_content(self, username: str, num_posts: int = 3, num_reels: int = 3, 
-                             content_type: str = CONTENT_BOTH) -> Dict[str, Any]:
+                             content_type: str = CONTENT_BOTH,
+                             scraped_at: Optional[str] = None) -> Dict[str, Any]:
         """
-        Enhanced: Scrape posts AND/OR reels from user's profile using modal navigation for posts.
+        Enhanced: Scrape posts AND/OR reels from user's profile.
+        Uses the JSON endpoint when available, otherwise modal navigation for posts.
+        scraped_at lets a batch stamp every profile with the same timestamp.
         """
-        if not self.quiet:
-            self.logger.info(f"STARTING ENHANCED SCRAPE FOR: {username} (posts: {num_posts}, reels: {num_reels})")
-        profile_url = f"https://www.instagram.com/{username}/"
-        
-        profile_data = {
+        self.logger.info("STARTING ENHANCED SCRAPE FOR: %s (posts: %d, reels: %d)", username, num_posts, num_reels)
+
+        cache_key = ProfileCache.make_key(username, content_type, num_posts, num_reels)
+        cached = self._get_cached_profile(cache_key)
+        if cached is not None:
+            return cached
+
+        # Fast path: one JSON request instead of page loads and modal clicks
+        profile_data = self._scrape_profile_via_http(username, num_posts, num_reels, content_type, scraped_at)
+        if profile_data is None:
+            if self._http_session is not None:
+                self.logger.info("Falling back to browser scraping for %s", username)
+            profile_data = self._scrape_profile_via_browser(username, num_posts, num_reels, content_type,
+                                                            scraped_at)
+
+        self._cache_profile(cache_key, profile_data)
+        return profile_data
+
+    def _get_cached_profile(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """Return a fresh cached profile, if caching is enabled"""
+        if self.cache is None:
+            return None
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            self.logger.info("Cache hit for %s (scraped_at %s)", cache_key, cached.get('scraped_at'))
+        return cached
+
+    def _cache_profile(self, cache_key: str, profile_data: Dict[str, Any]) -> None:
+        """Cache non-empty results so transient failures are retried next run"""
+        if self.cache is not None and (profile_data.get("posts") or profile_data.get("reels")):
+            self.cache.set(cache_key, profile_data)
+
+    def _scrape_profile_via_browser(self, username: str, num_posts: int, num_reels: int,
+                                    content_type: str, scraped_at: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Scrape posts (modal navigation) and reels (link discovery) by rendering the profile page.
+        A login wall or challenge backs off exponentially, rotates to the next saved
+        session and retries, up to BLOCK_MAX_RETRIES times; with no other session to
+        rotate to, the profile is given up on straight away.
+        """
+        # One timestamp for the profile and every item in it
+        scraped_at = scraped_at or _utc_now_iso()
+
+        for attempt in range(1, BLOCK_MAX_RETRIES + 2):
+            try:
+                return self._scrape_profile_page(username, num_posts, num_reels, content_type, scraped_at)
+            except RateLimited as e:
+                # The cooldown is waited out by the rate limiter on the next request
+                cooldown = self.rate_limiter.penalize()
+                page_rate = self.page_bucket.penalize()
+                self.logger.error(
+                    "Blocked while scraping %s (%s) - backing off %.0fs, one profile page per %.0fs "
+                    "(attempt %d/%d)", username, e, cooldown, 1 / page_rate, attempt, BLOCK_MAX_RETRIES + 1
+                )
+                if attempt > BLOCK_MAX_RETRIES or not self._rotate_session():
+                    break
+
+        return self._new_profile_data(username, scraped_at)
+
+    @staticmethod
+    def _new_profile_data(username: str, scraped_at: str) -> Dict[str, Any]:
+        """Empty profile record that the scrape paths fill in"""
+        return {
             "username": username,
-            "profile_url": profile_url,
-            "scraped_at": datetime.now().isoformat(),
+            "profile_url": f"https://www.instagram.com/{username}/",
+            "scraped_at": scraped_at,
             "posts": [],
             "reels": []
         }
 
+    def _raise_if_blocked(self) -> None:
+        """Raise RateLimited if the browser was sent to a login wall or challenge"""
+        current_url = self.driver.current_url
+        if "accounts/login" in current_url or "challenge" in current_url:
+            raise RateLimited(f"redirected to {current_url}")
+
+    def _scrape_profile_page(self, username: str, num_posts: int, num_reels: int,
+                             content_type: str, scraped_at: str) -> Dict[str, Any]:
+        """
+        One attempt at a browser scrape. Raises RateLimited on a login wall or
+        challenge; other errors return whatever was collected.
+        """
+        profile_data = self._new_profile_data(username, scraped_at)
+        profile_url = profile_data["profile_url"]
+
         try:
-            # Navigate to profile
+            # Navigate to profile (drop network events from earlier pages first)
+            self._drain_performance_log()
+            waited = self.page_bucket.acquire()
+            if waited:
+                self.logger.info("Waited %.1fs for a profile page slot", waited)
+            self.rate_limiter.acquire()
             self.driver.get(profile_url)
-            if not self.quiet:
-                self.logger.info(f"Navigated to {profile_url}")
+            self.logger.info("Navigated to %s", profile_url)
 
             # Wait for profile to load properly
             if not self._wait_for_profile_load():
-                if not self.quiet:
-                    self.logger.error(f"Profile failed to load: {username}")
+                self.logger.error("Profile failed to load: %s", username)
                 return profile_data
 
             # Check for redirects to login (session might have expired during scraping)
-            current_url = self.driver.current_url
-            if "accounts/login" in current_url or "challenge" in current_url:
-                if not self.quiet:
-                    self.logger.error("Redirected to login/challenge page - session may have expired")
-                return profile_data
+            self._raise_if_blocked()
+            self.rate_limiter.reset()
+            self.page_bucket.reward()
 
-            # Scrape posts using modal navigation
+            # Scrape posts from the page's own GraphQL response, else via modal navigation
             if content_type in [CONTENT_POSTS, CONTENT_BOTH] and num_posts > 0:
-                posts_data = self.scrape_posts_via_modal_navigation(username, num_posts)
+                posts_data = self.scrape_posts_from_network(num_posts, scraped_at=scraped_at)
+                if len(posts_data) >= num_posts:
+                    self.logger.info("Network capture: %d posts collected", len(posts_data))
+                else:
+                    posts_data = self.scrape_posts_via_modal_navigation(
+                        username, num_posts, scraped_at=scraped_at
+                    )
+                    self.logger.info("Modal navigation: %d posts collected", len(posts_data))
                 profile_data["posts"] = posts_data
-                if not self.quiet:
-                    self.logger.info(f"Modal navigation: {len(posts_data)} posts collected")
 
             # Scrape reels using traditional method
             if content_type in [CONTENT_REELS, CONTENT_BOTH] and num_reels > 0:
-                reels_data = self.scrape_reels_traditional(num_reels)
+                reels_data = self.scrape_reels_traditional(num_reels, scraped_at=scraped_at)
                 profile_data["reels"] = reels_data
-                if not self.quiet:
-                    self.logger.info(f"Traditional method: {len(reels_data)} reels collected")
+                self.logger.info("Traditional method: %d reels collected", len(reels_data))
 
             return profile_data
 
+        except RateLimited:
+            raise
         except Exception as e:
-            if not self.quiet:
-                self.logger.error(f"ERROR scraping {username}: {e}")
+            self.logger.error("ERROR scraping %s: %s", username, e)
             return profile_data
 
     def _wait_for_profile_load(self) -> bool:
         """Wait for profile to load properly"""
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
+
         try:
-            # Wait for either posts or profile header to appear
-            WebDriverWait(self.driver, 15).until(
-                lambda driver: any([
-                    driver.find_elements(By.XPATH, "//a[contains(@href, '/p/')]"),
-                    driver.find_elements(By.XPATH, "//a[contains(@href, '/reel/')]"),
-                    driver.find_elements(By.XPATH, "//header"),
-                    driver.find_elements(By.TAG_NAME, "article")
-                ])
-            )
+            # Wait for either posts or profile header to appear (single union XPath per poll)
+            WebDriverWait(
+                self.driver, 15, ignored_exceptions=(StaleElementReferenceException,)
+            ).until(EC.presence_of_element_located((By.XPATH, PROFILE_LOADED_XPATH)))
             return True
         except TimeoutException:
-            if not self.quiet:
-                self.logger.warning("Profile load timeout - proceeding anyway")
+            self.logger.warning("Profile load timeout - proceeding anyway")
             return True  # Continue and try to scrape what's available
 
+    # --------------------------- Network Capture for Posts ---------------------------
+    def scrape_posts_from_network(self, num_posts: int = 3, timeout: float = SHORT_WAIT,
+                                  scraped_at: Optional[str] = None) -> List[Dict]:
+        """
+        Read post shortcodes from the timeline GraphQL response the profile page
+        already fetched (via the performance log + CDP), without opening any post.
+        Returns fewer than num_posts items when the response is not available.
+        """
+        scraped_at = scraped_at or _utc_now_iso()
+        posts_data = []
+        seen_codes = set()
+        pending_request_ids = []
+        deadline = time.monotonic() + timeout
+
+        try:
+            while len(posts_data) < num_posts and time.monotonic() < deadline:
+                for entry in self.driver.get_log("performance"):
+                    try:
+                        message = json.loads(entry["message"])["message"]
+                    except (ValueError, KeyError, TypeError):
+                        continue
+                    if message.get("method") != "Network.responseReceived":
+                        continue
+                    params = message.get("params", {})
+                    if GRAPHQL_URL_MARKER in params.get("response", {}).get("url", ""):
+                        pending_request_ids.append(params.get("requestId"))
+
+                still_pending = []
+                for request_id in pending_request_ids:
+                    try:
+                        body = self.driver.execute_cdp_cmd(
+                            "Network.getResponseBody", {"requestId": request_id}
+                        )
+                    except Exception:
+                        # Body not finished loading yet - retry on the next poll
+                        still_pending.append(request_id)
+                        continue
+                    for code in self._extract_timeline_codes(body.get("body", "")):
+                        if code in seen_codes:
+                            continue
+                        seen_codes.add(code)
+                        posts_data.append({
+                            "content_url": f"https://www.instagram.com/p/{code}/",
+                            "content_id": code,
+                            "scraped_at": scraped_at,
+                            "content_type": "post",
+                            "order": len(posts_data) + 1
+                        })
+                pending_request_ids = still_pending
+
+                if len(posts_data) < num_posts:
+                    time.sleep(NETWORK_POLL_INTERVAL)
+        except Exception as e:
+            self.logger.debug("Network capture unavailable: %s", e)
+
+        return posts_data[:num_posts]
+
+    @staticmethod
+    def _extract_timeline_codes(body: str) -> List[str]:
+        """Return post shortcodes from a timeline GraphQL response body, in order"""
+        try:
+            connection = json.loads(body)["data"][TIMELINE_CONNECTION_KEY]
+        except (ValueError, KeyError, TypeError):
+            return []
+        return [edge["node"]["code"] for edge in connection.get("edges", [])
+                if edge.get("node", {}).get("code")]
+
+    def _drain_performance_log(self) -> None:
+        """Discard buffered performance log entries"""
+        try:
+            self.driver.get_log("performance")
+        except Exception:
+            pass
+
     # --------------------------- Modal Navigation for Posts ---------------------------
-    def scrape_posts_via_modal_navigation(self, username: str, num_posts: int = 3) -> List[Dict]:
+    def scrape_posts_via_modal_navigation(self, username: str, num_posts: int = 3,
+                                          scraped_at: Optional[str] = None) -> List[Dict]:
         """
         NEW: Scrape posts by opening the first post and using right arrow navigation.
         This ensures we get posts in the correct chronological order.
         """
-        if not self.quiet:
-            self.logger.info(f"Starting modal navigation scraping for {username} (target: {num_posts} posts)")
+        self.logger.info("Starting modal navigation scraping for %s (target: %d posts)", username, num_posts)
         
         posts_data = []
         
@@ -494,26 +1493,25 @@ class InstagramScraperWithLogin:
             # Click on the first post to open modal
             first_post_clicked = self._click_first_post()
             if not first_post_clicked:
-                if not self.quiet:
-                    self.logger.error(f"Could not click first post for {username}")
+                self._raise_if_blocked()
+                self.logger.error("Could not click first post for %s", username)
                 return posts_data
 
-            # Wait for modal to load and get initial post
-            time.sleep(random.uniform(2.0, 3.0))
-            
             # Navigate through posts using right arrow
-            posts_data = self._navigate_posts_via_arrows(num_posts)
+            posts_data = self._navigate_posts_via_arrows(
+                num_posts, scraped_at or _utc_now_iso()
+            )
             
             # Close modal when done
             self._close_modal()
             
-            if not self.quiet:
-                self.logger.info(f"Modal navigation completed: {len(posts_data)} posts collected")
+            self.logger.info("Modal navigation completed: %d posts collected", len(posts_data))
             return posts_data
 
+        except RateLimited:
+            raise
         except Exception as e:
-            if not self.quiet:
-                self.logger.error(f"Modal navigation failed for {username}: {e}")
+            self.logger.error("Modal navigation failed for %s: %s", username, e)
             # Ensure modal is closed on error
             try:
                 self._close_modal()
@@ -523,42 +1521,38 @@ class InstagramScraperWithLogin:
 
     def _click_first_post(self) -> bool:
         """Click the first post in the profile grid to open modal"""
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.common.exceptions import TimeoutException
+
         try:
-            # Multiple strategies to find and click first post
-            selectors = [
-                # Primary selector for post thumbnails
-                "//article//a[contains(@href, '/p/')]",
-                "//div[contains(@class, '_aagw')]//a",  # Post container
-                "//a[contains(@href, '/p/')][1]",  # First post link
-            ]
-            
-            for selector in selectors:
-                try:
-                    first_post = WebDriverWait(self.driver, 8).until(
-                        EC.element_to_be_clickable((By.XPATH, selector))
-                    )
-                    first_post.click()
-                    if not self.quiet:
-                        self.logger.debug("Successfully clicked first post")
-                    return True
-                except (TimeoutException, Exception):
-                    continue
+            # Find and click the first post link in one JS round-trip (opens the modal)
+            try:
+                WebDriverWait(self.driver, 8).until(
+                    lambda driver: driver.execute_script(CLICK_FIRST_POST_JS, FIRST_POST_CSS)
+                )
+                # Wait for the modal to route to the post URL
+                WebDriverWait(self.driver, MODAL_LOAD_WAIT).until(
+                    lambda driver: "/p/" in driver.current_url
+                )
+                self.logger.debug("Successfully clicked first post")
+                return True
+            except TimeoutException:
+                pass
             
-            if not self.quiet:
-                self.logger.warning("Could not find clickable first post with any selector")
+            self.logger.warning("Could not find clickable first post with any selector")
             return False
             
         except Exception as e:
-            if not self.quiet:
-                self.logger.error(f"Error clicking first post: {e}")
+            self.logger.error("Error clicking first post: %s", e)
             return False
 
-    def _navigate_posts_via_arrows(self, num_posts: int) -> List[Dict]:
+    def _navigate_posts_via_arrows(self, num_posts: int, scraped_at: str) -> List[Dict]:
         """
         Navigate through posts using right arrow key or next button
         Returns list of post data in chronological order
         """
         posts_data = []
+        seen_urls = set()
         attempts = 0
         max_attempts = num_posts + 2  # Allow some extra attempts
         
@@ -567,35 +1561,38 @@ class InstagramScraperWithLogin:
             try:
                 # Get current post URL from modal
                 current_post_url = self._get_current_modal_post_url()
-                if current_post_url and current_post_url not in [p.get('content_url') for p in posts_data]:
-                    
+                if current_post_url and current_post_url not in seen_urls:
+                    seen_urls.add(current_post_url)
                     post_data = {
                         "content_url": current_post_url,
                         "content_id": self.extract_content_id(current_post_url),
-                        "scraped_at": datetime.now().isoformat(),
+                        "scraped_at": scraped_at,
                         "content_type": "post",
                         "order": len(posts_data) + 1
                     }
                     posts_data.append(post_data)
-                    if not self.quiet:
-                        self.logger.debug(f"Collected post {len(posts_data)}: {post_data['content_id']}")
+                    self.logger.debug("Collected post %d: %s", len(posts_data), post_data['content_id'])
                 
                 # Stop if we have enough posts
                 if len(posts_data) >= num_posts:
                     break
                     
                 # Navigate to next post
+                self.rate_limiter.acquire()
+                prev_url = self.driver.current_url
                 if not self._go_to_next_post():
-                    if not self.quiet:
-                        self.logger.debug("No next post available")
+                    self.logger.debug("No next post available")
                     break
                     
-                # Wait for next post to load
-                time.sleep(random.uniform(1.5, 2.5))
+                # Wait for next post to load (URL changes to the next /p/ page)
+                if not self._wait_for_url_change(prev_url):
+                    self._raise_if_blocked()
+                    self.logger.debug("Post URL did not change after navigation")
                 
+            except RateLimited:
+                raise
             except Exception as e:
-                if not self.quiet:
-                    self.logger.debug(f"Error during post navigation attempt {attempts}: {e}")
+                self.logger.debug("Error during post navigation attempt %d: %s", attempts, e)
                 break
         
         return posts_data
@@ -617,13 +1614,11 @@ class InstagramScraperWithLogin:
             if not clean_url.endswith('/'):
                 clean_url += '/'
                 
-            if not self.quiet:
-                self.logger.debug(f"Extracted clean post URL: {clean_url}")
+            self.logger.debug("Extracted clean post URL: %s", clean_url)
             return clean_url
             
         except Exception as e:
-            if not self.quiet:
-                self.logger.debug(f"Error getting modal URL from browser: {e}")
+            self.logger.debug("Error getting modal URL from browser: %s", e)
             return None
 
     def _go_to_next_post(self) -> bool:
@@ -631,32 +1626,29 @@ class InstagramScraperWithLogin:
         Navigate to next post using right arrow button or keyboard
         Returns True if successful, False if no next post
         """
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.common.keys import Keys
+        from selenium.webdriver.support.ui import WebDriverWait
+
         try:
-            # Strategy 1: Click next button (right arrow)
-            next_button_selectors = [
-                "//button[contains(@class, '_acah')]",  # Right arrow button
-                "//button[contains(@class, '_aade')]",  # Alternative next button
-                "//button[.//*[local-name()='svg']]",   # SVG arrow button
-            ]
-            
-            for selector in next_button_selectors:
-                try:
-                    next_btn = WebDriverWait(self.driver, 3).until(
-                        EC.element_to_be_clickable((By.XPATH, selector))
+            # Strategy 1: Click next button (right arrow), located in one JS round-trip
+            try:
+                next_btn = WebDriverWait(self.driver, 3).until(
+                    lambda driver: driver.execute_script(
+                        "return document.querySelector(arguments[0]);", NEXT_BUTTON_CSS
                     )
-                    next_btn.click()
-                    if not self.quiet:
-                        self.logger.debug("Clicked next button successfully")
-                    return True
-                except (TimeoutException, Exception):
-                    continue
+                )
+                next_btn.click()
+                self.logger.debug("Clicked next button successfully")
+                return True
+            except Exception:
+                pass
             
             # Strategy 2: Use keyboard right arrow (fallback)
             try:
                 body = self.driver.find_element(By.TAG_NAME, 'body')
                 body.send_keys(Keys.ARROW_RIGHT)
-                if not self.quiet:
-                    self.logger.debug("Used keyboard right arrow")
+                self.logger.debug("Used keyboard right arrow")
                 return True
             except Exception:
                 pass
@@ -664,52 +1656,46 @@ class InstagramScraperWithLogin:
             # Strategy 3: JavaScript click on next element
             try:
                 self.driver.execute_script("""
-                    var nextBtn = document.querySelector('button[class*="_acah"], button[class*="_aade"]');
+                    var nextBtn = document.querySelector(arguments[0]);
                     if (nextBtn) nextBtn.click();
-                """)
-                if not self.quiet:
-                    self.logger.debug("Used JavaScript click for next button")
+                """, NEXT_BUTTON_CSS)
+                self.logger.debug("Used JavaScript click for next button")
                 return True
             except Exception:
                 pass
                 
-            if not self.quiet:
-                self.logger.debug("No next post navigation method worked")
+            self.logger.debug("No next post navigation method worked")
             return False
             
         except Exception as e:
-            if not self.quiet:
-                self.logger.debug(f"Error navigating to next post: {e}")
+            self.logger.debug("Error navigating to next post: %s", e)
             return False
 
     def _close_modal(self) -> bool:
         """Close the post modal"""
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.common.keys import Keys
+        from selenium.webdriver.support.ui import WebDriverWait
+
         try:
-            # Multiple close button selectors
-            close_selectors = [
-                "//button[contains(@class, '_acab')]",  # X button
-                "//button[.//*[local-name()='svg']][@aria-label='Close']",
-                "//div[contains(@role, 'button')][@aria-label='Close']",
-            ]
-            
-            for selector in close_selectors:
-                try:
-                    close_btn = WebDriverWait(self.driver, 3).until(
-                        EC.element_to_be_clickable((By.XPATH, selector))
+            # X button or any close control, located in one JS round-trip
+            try:
+                close_btn = WebDriverWait(self.driver, 3).until(
+                    lambda driver: driver.execute_script(
+                        "return document.querySelector(arguments[0]);", CLOSE_BUTTON_CSS
                     )
-                    close_btn.click()
-                    if not self.quiet:
-                        self.logger.debug("Modal closed successfully")
-                    return True
-                except (TimeoutException, Exception):
-                    continue
+                )
+                close_btn.click()
+                self.logger.debug("Modal closed successfully")
+                return True
+            except Exception:
+                pass
             
             # Fallback: ESC key
             try:
                 body = self.driver.find_element(By.TAG_NAME, 'body')
                 body.send_keys(Keys.ESCAPE)
-                if not self.quiet:
-                    self.logger.debug("Used ESC key to close modal")
+                self.logger.debug("Used ESC key to close modal")
                 return True
             except Exception:
                 pass
@@ -717,17 +1703,16 @@ class InstagramScraperWithLogin:
             return False
             
         except Exception as e:
-            if not self.quiet:
-                self.logger.debug(f"Error closing modal: {e}")
+            self.logger.debug("Error closing modal: %s", e)
             return False
 
     # --------------------------- Traditional Reels Scraping ---------------------------
-    def scrape_reels_traditional(self, num_reels: int = 3) -> List[Dict]:
+    def scrape_reels_traditional(self, num_reels: int = 3,
+                                 scraped_at: Optional[str] = None) -> List[Dict]:
         """
         Scrape reels using traditional link discovery method
         """
-        if not self.quiet:
-            self.logger.info(f"Starting traditional reels scraping (target: {num_reels} reels)")
+        self.logger.info("Starting traditional reels scraping (target: %d reels)", num_reels)
         
         reels_data = []
         
@@ -735,100 +1720,243 @@ class InstagramScraperWithLogin:
             # Find reel URLs using traditional method
             reel_urls = self._find_reel_urls(num_reels)
             
-            for i, reel_url in enumerate(reel_urls):
-                time.sleep(random.uniform(0.2, 0.7))
-                reel_item = {
+            # URLs are already known locally - no navigation, so no delay needed
+            # One timestamp for the whole pass, computed before building the items
+            now_iso = scraped_at or _utc_now_iso()
+            reels_data = [
+                {
                     "content_url": reel_url,
                     "content_id": self.extract_content_id(reel_url),
-                    "scraped_at": datetime.now().isoformat(),
+                    "scraped_at": now_iso,
                     "content_type": "reel",
                     "order": i + 1
                 }
-                reels_data.append(reel_item)
+                for i, reel_url in enumerate(reel_urls)
+            ]
             
-            if not self.quiet:
-                self.logger.info(f"Traditional reels scraping completed: {len(reels_data)} reels collected")
+            self.logger.info("Traditional reels scraping completed: %d reels collected", len(reels_data))
             return reels_data
             
+        except RateLimited:
+            raise
         except Exception as e:
-            if not self.quiet:
-                self.logger.error(f"Traditional reels scraping failed: {e}")
+            self.logger.error("Traditional reels scraping failed: %s", e)
             return reels_data
 
     def _find_reel_urls(self, max_reels: int) -> List[str]:
         """
         Discover reel URLs on the current profile page.
         """
-        if not self.quiet:
-            self.logger.info("Starting reel discovery...")
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.common.exceptions import TimeoutException
+
+        self.logger.info("Starting reel discovery...")
 
         reel_urls = []
 
         try:
-            # Wait until some anchors are present to avoid empty discovery
+            # Poll with the extraction script itself: each poll is one round-trip that
+            # returns hrefs (deduped and capped in the page), never element references
             try:
                 short_wait_time = random.uniform(SHORT_WAIT_MIN, SHORT_WAIT_MAX)
-                short_wait = WebDriverWait(self.driver, short_wait_time) 
-                short_wait.until(EC.presence_of_all_elements_located((By.TAG_NAME, "a")))
+                reel_urls = WebDriverWait(self.driver, short_wait_time).until(
+                    lambda driver: self._collect_grid_links(REEL_LINK_CSS, max_reels)
+                )
             except TimeoutException:
-                if not self.quiet:
-                    self.logger.debug("No anchors found within SHORT_WAIT; attempting to fetch any anchors available")
-
-            # Collect hrefs from all anchor elements
-            anchors = self.driver.find_elements(By.TAG_NAME, "a")
-            ordered_reel_urls = []
-            
-            for a in anchors:
-                try:
-                    href = a.get_attribute("href")
-                    if href and "/reel/" in href and href not in ordered_reel_urls:
-                        ordered_reel_urls.append(href)
-                        if len(ordered_reel_urls) >= max_reels:
-                            break
-                except Exception:
-                    continue
+                self._raise_if_blocked()
+                self.logger.debug("No reel links found within SHORT_WAIT")
 
-            reel_urls = ordered_reel_urls
-            if not self.quiet:
-                self.logger.info(f"Discovered {len(reel_urls)} reel URL(s)")
+            self.logger.info("Discovered %d reel URL(s)", len(reel_urls))
             return reel_urls
 
+        except RateLimited:
+            raise
         except Exception as e:
-            if not self.quiet:
-                self.logger.error(f"_find_reel_urls encountered an exception: {e}")
+            self.logger.error("_find_reel_urls encountered an exception: %s", e)
             return reel_urls
 
     # --------------------------- Utility Methods ---------------------------
+    def _collect_grid_links(self, css: str, limit: int) -> List[str]:
+        """Return up to limit distinct hrefs of links matching css, in document order"""
+        try:
+            return list(self.driver.execute_script(GRID_LINKS_JS, css, limit) or [])
+        except Exception as e:
+            self.logger.debug("Could not collect grid links: %s", e)
+            return []
+
+    def _wait_for_page_ready(self, timeout: int = SHORT_WAIT) -> bool:
+        """Wait until document.readyState is 'complete'"""
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.common.exceptions import TimeoutException
+
+        try:
+            WebDriverWait(self.driver, timeout).until(
+                lambda driver: driver.execute_script("return document.readyState") == "complete"
+            )
+            return True
+        except TimeoutException:
+            self.logger.debug("Page did not reach readyState 'complete' in time")
+            return False
+
+    def _wait_for_url_change(self, prev_url: str, timeout: int = NAVIGATION_WAIT) -> bool:
+        """Wait until the browser moves from prev_url to another post URL"""
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.common.exceptions import TimeoutException
+
+        try:
+            WebDriverWait(self.driver, timeout).until(
+                lambda driver: driver.current_url != prev_url and "/p/" in driver.current_url
+            )
+            return True
+        except TimeoutException:
+            return False
+
     def extract_content_id(self, content_url: str) -> str:
         """
         Extract the canonical short-code from post OR reel URL.
         Enhanced version with reels support.
         """
-        try:
-            if "/p/" in content_url:
-                content_id = content_url.split("/p/")[1].split("/")[0]
-            elif "/reel/" in content_url:
-                content_id = content_url.split("/reel/")[1].split("/")[0]
-            else:
-                content_id = "unknown"
-            
-            if not self.quiet:
-                self.logger.debug(f"Extracted content id: {content_id}")
-            return content_id
-        except Exception:
-            if not self.quiet:
-                self.logger.debug("Could not extract content id from URL")
-            return "unknown"
+        match = _CONTENT_ID_RE.search(content_url)
+        content_id = match.group(1) if match else "unknown"
+        self.logger.debug("Extracted content id: %s", content_id)
+        return content_id
 
     # --------------------------- Multiple Profiles Scrape ----------------------------
+    def scrape_profiles_batch(self, usernames: List[str], num_posts: int = 4, num_reels: int = 2,
+                              content_type: str = CONTENT_BOTH,
+                              concurrency: int = BATCH_CONCURRENCY,
+                              scraped_at: Optional[str] = None,
+                              on_result: Optional[Callable[[str, Dict[str, Any]], None]] = None
+                              ) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch several profiles concurrently over the JSON endpoint.
+        Returns {username: {"profile": profile_data or None, "elapsed": seconds}};
+        a None profile means the caller should fall back to the browser.
+        With on_result, each fetched profile is passed to on_result(username, result)
+        in this thread as soon as it completes and left out of the returned dict,
+        which then only holds the profiles to fall back on.
+        """
+        def fetch(username: str) -> Dict[str, Any]:
+            # Pacing is handled by the shared rate limiter inside the request
+            start_time = time.perf_counter()
+            try:
+                profile_data = self._scrape_profile_via_http(username, num_posts, num_reels, content_type,
+                                                             scraped_at)
+            except Exception as e:
+                # One bad response must not abort the batch; the browser retries this profile
+                self.logger.warning("HTTP fetch failed for %s - falling back to browser: %s", username, e)
+                profile_data = None
+            return {"profile": profile_data, "elapsed": time.perf_counter() - start_time}
+
+        if self._http_session is None or not usernames:
+            return {username: {"profile": None, "elapsed": 0.0} for username in usernames}
+
+        workers = max(1, min(concurrency, len(usernames)))
+        self.logger.info("Fetching %d profiles over HTTP with %d workers", len(usernames), workers)
+        results = {}
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(fetch, username): username for username in usernames}
+            for future in as_completed(futures):
+                username = futures[future]
+                result = future.result()
+                if on_result is not None and result["profile"] is not None:
+                    on_result(username, result)
+                else:
+                    results[username] = result
+        return {username: results[username] for username in usernames if username in results}
+
+    def scrape_profiles_in_workers(self, usernames: List[str], num_posts: int = 4, num_reels: int = 2,
+                                   content_type: str = CONTENT_BOTH,
+                                   workers: int = BROWSER_WORKERS,
+                                   scraped_at: Optional[str] = None,
+                                   on_result: Optional[Callable[[str, Dict[str, Any]], None]] = None
+                                   ) -> Dict[str, Dict[str, Any]]:
+        """
+        Scrape profiles through the browser in parallel worker processes, each with
+        its own Chrome instance that stays warm across profiles. Workers restore this
+        browser's session from a private temporary file instead of logging in. Returns
+        the same shape as scrape_profiles_batch; a None profile means the worker failed
+        and the caller should scrape it in-process. on_result works as in scrape_profiles_batch.
+        """
+        results = {username: {"profile": None, "elapsed": 0.0} for username in usernames}
+        if not usernames:
+            return results
+
+        # Workers restore this session instead of submitting credentials. A private
+        # temp file leaves the saved session alone (and unwritten with --no-session).
+        fd, session_path = tempfile.mkstemp(prefix="instagram_session_", suffix=".json")
+        os.close(fd)
+        try:
+            if not self.save_session(session_path):
+                self.logger.warning("Could not save session for workers - scraping in-process")
+                return results
+
+            workers = max(1, min(workers, len(usernames)))
+            worker_kwargs = dict(self._worker_kwargs)
+            # Keep the combined request rate at the configured limit
+            worker_kwargs["rate_per_min"] = max(1, self.rate_limiter.max_per_min // workers)
+            worker_kwargs["page_rate"] = self.page_bucket.max_rate / workers
+            self.logger.info("Scraping %d profiles in %d browser workers", len(usernames), workers)
+
+            # max_workers bounds how many Chrome instances run at once; spawn avoids
+            # forking this process's logging and rate-limiter threads
+            ctx = multiprocessing.get_context("spawn")
+            # Each worker takes one slot number for its Chrome profile, so runs reuse
+            # .chrome_profile_worker0..N-1 instead of leaving a new directory per PID
+            slots = ctx.Queue()
+            for slot in range(workers):
+                slots.put(slot)
+            with ProcessPoolExecutor(max_workers=workers,
+                                     mp_context=ctx,
+                                     initializer=_init_browser_worker,
+                                     initargs=(worker_kwargs, session_path, slots,
+                                               self._session_path if self.use_session else None)) as executor:
+                futures = {
+                    executor.submit(_scrape_profile_worker, username,
+                                    num_posts, num_reels, content_type, scraped_at): username
+                    for username in usernames
+                }
+                for future in as_completed(futures):
+                    username = futures[future]
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        self.logger.warning("Browser worker failed for %s: %s", username, e)
+                        continue
+                    if on_result is not None and result["profile"] is not None:
+                        del results[username]
+                        on_result(username, result)
+                    else:
+                        results[username] = result
+        finally:
+            try:
+                os.remove(session_path)
+            except OSError:
+                pass
+        return results
+
     def scrape_multiple_profiles(self, usernames: List[str], posts_per_profile: int = 4, 
-                               reels_per_profile: int = 2, content_type: str = CONTENT_BOTH) -> Dict[str, Any]:
+                               reels_per_profile: int = 2, content_type: str = CONTENT_BOTH,
+                               concurrency: int = BATCH_CONCURRENCY,
+                               results_path: Optional[str] = None,
+                               workers: int = BROWSER_WORKERS,
+                               stream: Optional[TextIO] = None) -> Dict[str, Any]:
         """
-        Scrape multiple profiles and return combined results as JSON
+        Scrape multiple profiles and return combined results as JSON.
+        Profiles are fetched concurrently over HTTP; only failures go through the browser,
+        in parallel worker processes when workers > 1.
+        With results_path, each profile result is appended there as NDJSON as soon as
+        its fetch completes (in completion order) and the combined "profiles" list is
+        read back from the file at the end, in input order.
+        With stream, each profile result is written to it as an NDJSON line instead,
+        followed by a {"type": "summary", ...} line; the returned "profiles" is empty.
         """
-        if not self.quiet:
-            self.logger.info(f"STARTING MULTI-PROFILE SCRAPE: {len(usernames)} users")
-        
+        # Results are keyed by username, so each profile is scraped once
+        usernames = list(dict.fromkeys(usernames))
+        self.logger.info("STARTING MULTI-PROFILE SCRAPE: %d users", len(usernames))
+
+        # One timestamp for the whole batch: the summary and every scraped item
+        batch_ts = _utc_now_iso()
         all_results = {
             "profiles": [],
             "summary": {
@@ -836,22 +1964,30 @@ class InstagramScraperWithLogin:
                 "successful_profiles": 0,
                 "total_posts": 0,
                 "total_reels": 0,
-                "scraped_at": datetime.now().isoformat()
+                "scraped_at": batch_ts
             }
         }
 
-        for i, username in enumerate(usernames, 1):
-            if not self.quiet:
-                self.logger.info(f"Scraping profile {i}/{len(usernames)}: {username}")
-            
-            start_time = time.time()
-            profile_data = self.scrape_profile_content(
-                username, 
-                num_posts=posts_per_profile, 
-                num_reels=reels_per_profile, 
-                content_type=content_type
-            )
-            elapsed = time.time() - start_time
+        cache_keys = {
+            username: ProfileCache.make_key(username, content_type, posts_per_profile, reels_per_profile)
+            for username in usernames
+        }
+        # Profiles served from the cache (not written back to it)
+        cached = set()
+        finished = 0
+        # Profiles are emitted as they finish; the combined list is put back in input order
+        order = {username: i for i, username in enumerate(usernames)}
+
+        def emit(username: str, result: Dict[str, Any]) -> None:
+            """Record one finished profile: cache it, write it out and count it"""
+            nonlocal finished
+            profile_data = result["profile"]
+            elapsed = result["elapsed"]
+            finished += 1
+            self.logger.info("Finished profile %d/%d: %s", finished, len(usernames), username)
+
+            if username not in cached:
+                self._cache_profile(cache_keys[username], profile_data)
 
             # Create individual profile result
             profile_result = {
@@ -860,38 +1996,89 @@ class InstagramScraperWithLogin:
                     "username": username,
                     "posts_count": len(profile_data.get("posts", [])),
                     "reels_count": len(profile_data.get("reels", [])),
-                    "scraping_time_seconds": round(elapsed, 2),
+                    "scraping_time_seconds": elapsed,
                     "success": len(profile_data.get("posts", [])) > 0 or len(profile_data.get("reels", [])) > 0
                 }
             }
 
-            # Update combined results
-            all_results["profiles"].append(profile_result)
-            
+            # Update combined results (streamed to disk when a results file is used)
+            if results_writer is not None:
+                results_writer.write(profile_result)
+            elif stream is None:
+                all_results["profiles"].append(profile_result)
+            if stream is not None:
+                stream.write(json.dumps(profile_result, ensure_ascii=False) + "\n")
+                stream.flush()
+        
             if profile_result["summary"]["success"]:
                 all_results["summary"]["successful_profiles"] += 1
                 all_results["summary"]["total_posts"] += profile_result["summary"]["posts_count"]
                 all_results["summary"]["total_reels"] += profile_result["summary"]["reels_count"]
-                if not self.quiet:
-                    self.logger.info(f"SUCCESS: {username} - {profile_result['summary']['posts_count']} posts, {profile_result['summary']['reels_count']} reels in {elapsed:.2f}s")
+                self.logger.info(
+                    "SUCCESS: %s - %d posts, %d reels in %.2fs", username,
+                    profile_result['summary']['posts_count'], profile_result['summary']['reels_count'], elapsed
+                )
             else:
-                if not self.quiet:
-                    self.logger.warning(f"FAILED/EMPTY: {username} (completed in {elapsed:.2f}s)")
+                self.logger.warning("FAILED/EMPTY: %s (completed in %.2fs)", username, elapsed)
+
+        # Opened before any fetching, so an interrupted run keeps every profile already finished
+        results_writer = ResultsWriter(results_path) if results_path else None
+        try:
+            for username in usernames:
+                cached_profile = self._get_cached_profile(cache_keys[username])
+                if cached_profile is not None:
+                    cached.add(username)
+                    emit(username, {"profile": cached_profile, "elapsed": 0.0})
+
+            pending = self.scrape_profiles_batch(
+                [username for username in usernames if username not in cached],
+                num_posts=posts_per_profile,
+                num_reels=reels_per_profile,
+                content_type=content_type,
+                concurrency=concurrency,
+                scraped_at=batch_ts,
+                on_result=emit
+            )
+            if workers > 1 and pending:
+                pending = self.scrape_profiles_in_workers(
+                    list(pending),
+                    num_posts=posts_per_profile,
+                    num_reels=reels_per_profile,
+                    content_type=content_type,
+                    workers=workers,
+                    scraped_at=batch_ts,
+                    on_result=emit
+                )
 
-            # Add delay between profiles (except for the last one)
-            if i < len(usernames):
-                delay = random.randint(PROFILE_DELAY_MIN, PROFILE_DELAY_MAX)
-                if not self.quiet:
-                    self.logger.info(f"Waiting {delay}s before next profile")
-                time.sleep(delay)
+            # Whatever the HTTP batch and the workers could not scrape goes through this browser
+            for username in pending:
+                self.logger.info("Scraping %s through the browser", username)
+                start_time = time.perf_counter()
+                profile_data = self._scrape_profile_via_browser(
+                    username, 
+                    num_posts=posts_per_profile, 
+                    num_reels=reels_per_profile, 
+                    content_type=content_type,
+                    scraped_at=batch_ts
+                )
+                emit(username, {"profile": profile_data, "elapsed": time.perf_counter() - start_time})
+        finally:
+            if results_writer is not None:
+                results_writer.close()
+
+        if results_writer is not None and stream is None:
+            all_results["profiles"] = results_writer.read_back()
+        all_results["profiles"].sort(key=lambda r: order[r["summary"]["username"]])
 
         # Calculate success rate
         total = all_results["summary"]["total_profiles"]
         success_count = all_results["summary"]["successful_profiles"]
         all_results["summary"]["success_rate"] = round((success_count / total * 100) if total else 0.0, 2)
+        if stream is not None:
+            stream.write(json.dumps({"type": "summary", **all_results["summary"]}, ensure_ascii=False) + "\n")
+            stream.flush()
 
-        if not self.quiet:
-            self.logger.info(f"MULTI-PROFILE SCRAPE COMPLETE: {success_count}/{total} successful")
+        self.logger.info("MULTI-PROFILE SCRAPE COMPLETE: %d/%d successful", success_count, total)
         return all_results
 
     # --------------------------- Close -----------------------------------
@@ -899,22 +2086,85 @@ class InstagramScraperWithLogin:
         """
         Close the WebDriver and clean up resources.
         """
-        if not self.quiet:
-            self.logger.info("Closing browser...")
+        self.logger.info("Closing browser...")
         try:
             if self.driver:
                 self.driver.quit()
-                if not self.quiet:
-                    self.logger.info("Browser closed")
+                self.logger.info("Browser closed")
         except Exception as e:
-            if not self.quiet:
-                self.logger.debug(f"Exception during driver.quit(): {e}")
+            self.logger.debug("Exception during driver.quit(): %s", e)
+        finally:
+            # Drain queued log records and stop the writer thread
+            if self._log_listener is not None:
+                logging.getLogger().removeHandler(self._log_queue_handler)
+                self._log_listener.stop()
+                self._log_listener = None
+
+# -----------------------------------------------------------------------------
+# Browser worker processes
+# -----------------------------------------------------------------------------
+# Warm scraper owned by this worker process, reused for every profile it is given
+_worker_scraper: Optional["InstagramScraperWithLogin"] = None
+
+
+def _init_browser_worker(scraper_kwargs: Dict[str, Any], session_path: str,
+                         slots: "multiprocessing.Queue", pool_session: Optional[str] = None) -> None:
+    """
+    Process-pool initializer: start one browser per worker process and restore the
+    parent's saved session, so Chrome cold-starts once per worker, not per profile.
+    slots hands out worker numbers 0..N-1 for the per-worker Chrome profile.
+    pool_session is the parent's session file, which rotation after a block moves on
+    from; None (--no-session) keeps workers out of the session pool.
+    """
+    global _worker_scraper
+    import multiprocessing.util
+
+    slot = slots.get()
+    kwargs = dict(scraper_kwargs)
+    if kwargs.get("profile_dir"):
+        # Chrome refuses to share a user-data-dir between running instances
+        kwargs["profile_dir"] = f"{kwargs['profile_dir']}_worker{slot}"
+
+    scraper = None
+    try:
+        scraper = InstagramScraperWithLogin(**kwargs)
+        scraper.use_session = pool_session is not None
+        # The session file belongs to the parent: never delete it from here
+        if not scraper.load_session(session_path, remove_invalid=False):
+            scraper.close()
+            return
+        scraper._session_path = pool_session or session_path
+    except Exception:
+        # Leave _worker_scraper unset; tasks report failure and the parent falls back
+        if scraper:
+            scraper.close()
+        return
+
+    _worker_scraper = scraper
+    # Pool workers exit without running atexit hooks, but finalizers do run
+    multiprocessing.util.Finalize(scraper, scraper.close, exitpriority=10)
+
+
+def _scrape_profile_worker(username: str, num_posts: int, num_reels: int, content_type: str,
+                           scraped_at: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Process-pool task: scrape one profile with this worker's warm browser.
+    Returns {"profile": data or None, "elapsed": seconds}.
+    """
+    start_time = time.perf_counter()
+    if _worker_scraper is None:
+        return {"profile": None, "elapsed": 0.0}
+    profile_data = _worker_scraper._scrape_profile_via_browser(username, num_posts, num_reels, content_type,
+                                                               scraped_at)
+    return {"profile": profile_data, "elapsed": time.perf_counter() - start_time}
 
 # -----------------------------------------------------------------------------
 # Command-line argument parsing
 # -----------------------------------------------------------------------------
 def parse_arguments():
     """Parse command-line arguments"""
+    import argparse
+
     parser = argparse.ArgumentParser(description='Instagram Scraper for multiple users')
     parser.add_argument('-u', '--users', required=True, nargs='+', 
                        help='Instagram usernames to scrape (space-separated)')
@@ -928,6 +2178,22 @@ def parse_arguments():
                        help='Disable session persistence (force fresh login)')
     parser.add_argument('--quiet', action='store_true',
                        help='Suppress all logging output (only JSON output)')
+    parser.add_argument('--no-chrome-profile', action='store_true',
+                       help=f'Use a throwaway Chrome profile instead of {CHROME_PROFILE_DIR}/')
+    parser.add_argument('--no-block-media', action='store_true',
+                       help='Let Chrome download images, video and fonts (blocked by default)')
+    parser.add_argument('--cache-ttl', type=int, default=CACHE_TTL,
+                       help=f'Reuse profiles scraped within this many seconds, 0 disables (default: {CACHE_TTL})')
+    parser.add_argument('--rate', type=int, default=RATE_LIMIT_PER_MIN,
+                       help=f'Max Instagram requests per minute (default: {RATE_LIMIT_PER_MIN})')
+    parser.add_argument('--pretty', action='store_true',
+                       help='Indent the JSON written to stdout (default: compact)')
+    parser.add_argument('--ndjson', action='store_true',
+                       help='Stream one JSON line per profile to stdout, then a summary line')
+    parser.add_argument('-w', '--workers', type=int, default=BROWSER_WORKERS,
+                       help=f'Parallel browser processes for profiles the HTTP path cannot serve (default: {BROWSER_WORKERS})')
+    parser.add_argument('-c', '--concurrency', type=int, default=BATCH_CONCURRENCY,
+                       help=f'Max profiles fetched in parallel over HTTP (default: {BATCH_CONCURRENCY})')
     
     return parser.parse_args()
 
@@ -940,8 +2206,12 @@ def main():
     """
     # Parse command-line arguments
     args = parse_arguments()
+
+    # Results are UTF-8 JSON; write stdout in blocks rather than per line
+    sys.stdout.reconfigure(encoding='utf-8', line_buffering=False)
     
     # Load environment variables from .env in current directory
+    from dotenv import load_dotenv
     load_dotenv()
     IG_USERNAME = os.getenv("IG_USERNAME")
     IG_PASSWORD = os.getenv("IG_PASSWORD")
@@ -956,7 +2226,8 @@ def main():
     USE_SESSION = not args.no_session
     QUIET_MODE = args.quiet
 
-    if not IG_USERNAME or not IG_PASSWORD:
+    # Credentials are only required when there is no saved session to fall back on
+    if (not IG_USERNAME or not IG_PASSWORD) and not USE_SESSION:
         if not QUIET_MODE:
             print("ERROR: IG_USERNAME and IG_PASSWORD must be set in a .env file in the script directory.", file=sys.stderr)
             print("Create a .env file with:", file=sys.stderr)
@@ -967,7 +2238,12 @@ def main():
     scraper = None
     try:
         # Initialize scraper with the chosen headless setting
-        scraper = InstagramScraperWithLogin(headless=HEADLESS, quiet=QUIET_MODE)
+        scraper = InstagramScraperWithLogin(
+            headless=HEADLESS, quiet=QUIET_MODE, block_media=not args.no_block_media,
+            cache_ttl=args.cache_ttl,
+            rate_per_min=args.rate,
+            profile_dir=None if args.no_chrome_profile else CHROME_PROFILE_DIR
+        )
 
         # Attempt login (with session persistence)
         if not QUIET_MODE:
@@ -978,20 +2254,35 @@ def main():
                 print("Login failed. Please check credentials or account challenge.", file=sys.stderr)
             sys.exit(1)
 
-        # Small pause after login for stability
-        time.sleep(random.uniform(2.4, 4.0))
+        # Results are appended here per profile, so an interrupted run keeps its progress
+        ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+        results_path = os.path.join(OUTPUT_DIR, f"results_{ts}.ndjson")
+        if not QUIET_MODE:
+            print(f"Writing per-profile results to {results_path}", file=sys.stderr)
+
+        # Pace the first profile request against the login traffic
+        scraper.rate_limiter.acquire()
 
         # Scrape multiple profiles
         results = scraper.scrape_multiple_profiles(
             usernames=TARGET_USERS,
             posts_per_profile=POSTS_PER_PROFILE,
             reels_per_profile=REELS_PER_PROFILE,
-            content_type=CONTENT_TYPE
+            content_type=CONTENT_TYPE,
+            concurrency=args.concurrency,
+            results_path=results_path,
+            workers=args.workers,
+            stream=sys.stdout if args.ndjson else None
         )
 
-        # Output results as JSON to stdout
-        json.dump(results, sys.stdout, indent=2, ensure_ascii=False)
-        sys.stdout.write('\n')  # Add newline at the end
+        # Output results as JSON to stdout (already streamed line by line with --ndjson);
+        # compact unless --pretty, serialized first and written in one call
+        if not args.ndjson:
+            if args.pretty:
+                output = json.dumps(results, indent=2, ensure_ascii=False)
+            else:
+                output = json.dumps(results, separators=(',', ':'), ensure_ascii=False)
+            sys.stdout.write(output + '\n')
 
     except Exception as e:
         if not QUIET_MODE: